@@ -4,9 +4,14 @@ closing the ones for systems that are offline
 '''
 from __future__ import print_function
 import logging
-from os import system
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from subprocess import run, DEVNULL
 from cauimws import get_alarms, get_hubs, remove_robot, acknowledge_alarm
 
+# Number of alarms processed concurrently; each one blocks on ping + REST
+MAX_WORKERS = 16
+
 
 def is_reachable(device, retries, ttl):
     '''Checks if device can be pinged on the network
@@ -19,12 +24,13 @@ def is_reachable(device, retries, ttl):
     Returns:
         True if ping successful, False if not
     '''
-    # Build and run the Windows ping command. Change according to operating system
-    command = 'ping -n ' + str(retries) + ' -i ' + str(ttl) + ' ' + device + ' >nul 2>&1'
-    response = system(command)
+    # Build the Windows ping command. Change according to operating system
+    # A list argv with discarded output avoids spawning a shell per ping
+    command = ['ping', '-n', str(retries), '-i', str(ttl), device]
+    response = run(command, stdout=DEVNULL, stderr=DEVNULL)
 
     # 0 means a successful ping response
-    if response == 0:
+    if response.returncode == 0:
         pingable = True
     else:
         pingable = False
@@ -54,6 +60,55 @@ def find_hub_robot(hubs, hub_name):
     return robot
 
 
+def map_hub_robots(hubs):
+    '''Builds a hub name to hub robot name lookup table
+
+    Args:
+        hubs (dict) of UIM hubs as returned by get_hubs
+
+    Returns:
+        (dict) mapping each hub name to the robot hosting it
+    '''
+    return {hub['name']: hub['robotName'] for hub in hubs}
+
+
+def process_alarm(uim_ws, hub_robots, retry, ttl, alarm):
+    '''Handles a single Robot Inactive alarm, closing it if the robot is offline
+
+    Args:
+        uim_ws (dict) of UIM REST API information
+        hub_robots (dict) mapping hub names to their hosting robots
+        retry (number) of times to check with ping
+        ttl (number) timeout of each ping
+        alarm (dict) the UIM alarm to process
+
+    Returns:
+        True if the alarm was acknowledged, False if it was left open
+    '''
+    logging.info('%s --> %s', alarm['source'], alarm['message'])
+
+    acked = False
+    # Check to see if alarm source is online
+    if is_reachable(alarm['source'], retry, ttl):
+        logging.info('Device %s is online. Leaving alarm open', alarm['source'])
+    else:
+        logging.warning(
+            'Robot %s is offline. Removing from hub and acknowledging alarm',
+            alarm['robot'][0]
+        )
+        # Look up the robot hosting our hub in the prebuilt table
+        hub_robot = hub_robots.get(alarm['hub'][0])
+
+        # Remove the offline robot from the hub so it stops checking it
+        remove_robot(uim_ws, alarm['hub'][0], hub_robot, alarm['robot'][0])
+
+        # Close the robot inactive alarm
+        # --> Robot will join hub when it comes back online
+        acked = acknowledge_alarm(uim_ws, alarm['id'])
+
+    return acked
+
+
 def main():
     '''Finds open CA Unified Infrastructure Management Robot Inactive alarms
     closing the ones for systems that are offline
@@ -78,31 +133,21 @@ def main():
     uim_ws['url'] = 'http://ump.ca.com/rest'
     uim_ws['domain'] = 'uim_domain'
 
+    # Get the list of all the UIM hubs once; it does not change during a run
+    # and build the hub to robot lookup so alarms skip the linear scan
+    hub_robots = map_hub_robots(get_hubs(uim_ws))
+
     # Get a list of alarms matching the filter
     alarms = get_alarms(uim_ws, alarm_filter)
-    for alarm in alarms:
-        logging.info('%s --> %s', alarm['source'], alarm['message'])
-
-        # Check to see if alarm source is online
-        if is_reachable(alarm['source'], retry, ttl):
-            logging.info('Device %s is online. Leaving alarm open', alarm['source'])
-        else:
-            logging.warning(
-                'Robot %s is offline. Removing from hub and acknowledging alarm',
-                alarm['robot'][0]
-            )
-            # Get a list of all the UIM hubs
-            hubs = get_hubs(uim_ws)
-
-            # Search the hubs by name to find the robot hosting our hub
-            hub_robot = find_hub_robot(hubs, alarm['hub'][0])
-
-            # Remove the offline robot from the hub so it stops checking it
-            remove_robot(uim_ws, alarm['hub'][0], hub_robot, alarm['robot'][0])
-
-            # Close the robot inactive alarm
-            # --> Robot will join hub when it comes back online
-            acknowledge_alarm(uim_ws, alarm['id'])
+
+    # Each alarm is independent and the work is ping + REST calls, so
+    # process them concurrently on a thread pool
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(
+            executor.map(partial(process_alarm, uim_ws, hub_robots, retry, ttl), alarms)
+        )
+
+    logging.info('Acknowledged %s of %s alarms', sum(results), len(results))
 
 
 if __name__ == '__main__':
@@ -4,13 +4,330 @@ REST API
 '''
 from __future__ import print_function
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial, wraps
 from socket import gethostbyname, gaierror
-from json import loads, dumps
-from re import search
-from requests import get, post, put, delete, ConnectionError, Timeout
+from json import dumps
+from re import compile as re_compile
+import ssl
+from threading import Lock
+from time import monotonic
+from urllib.parse import quote
+from requests import Session, ConnectionError, Timeout
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3 import disable_warnings
+from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 
+# The UIM API is normally called without certificate verification so
+# silence the InsecureRequestWarning once instead of on every request
+disable_warnings(InsecureRequestWarning)
 
+# One relaxed SSLContext shared by every connection pool instead of
+# urllib3 building an unverified context per pool
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.check_hostname = False
+_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+
+class _PinnedContextAdapter(HTTPAdapter):
+    '''HTTPAdapter that pins the shared relaxed SSLContext on its pools'''
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = _SSL_CONTEXT
+        return super(_PinnedContextAdapter, self).init_poolmanager(*args, **kwargs)
+
+# Connect and read timeouts applied to the API calls
+_TIMEOUT = (3, 15)
+
+# Every endpoint speaks JSON; share one headers dict instead of building
+# a fresh literal per call
+_JSON_HEADERS = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json',
+    'Accept-Encoding': 'gzip, deflate'
+}
+
+# Extracts the robot name from a /domain/hub/robot UIM address
+_ROBOT_RE = re_compile(r'/.+/.+/(.+)$')
+
+# Shared query string for domain-scoped listings; read-only, never mutated
+_DOMAIN_PARAMS = {'inCurrentDomain': 'true'}
+
+# UIM alarm level names mapped to their numeric severities
+_SEVERITY = {
+    'clear': '0',
+    'info': '1',
+    'warning': '2',
+    'minor': '3',
+    'major': '4',
+    'critical': '5'
+}
+
+# Pre-serialized single-parameter callback bodies; only the value field
+# changes per call, and dumps is kept just to JSON-escape it
+_NAME_CB_TMPL = '{"parameters": {"name": "name", "type": "string", "value": %s}}'
+_ROBOT_CB_TMPL = '{"parameters": {"name": "robot", "type": "string", "value": %s}}'
+
+_SESSION = None
+_SESSION_LOCK = Lock()
+
+# In-flight read requests keyed by call so concurrent threads asking
+# the same question share one REST round trip
+_INFLIGHT = {}
+_INFLIGHT_LOCK = Lock()
+
+
+def _coalesced(func):
+    '''Decorator that deduplicates concurrent identical read calls
+
+    When several threads call the same function with the same arguments
+    at the same time, only the first issues the request; the others wait
+    on its Future and share the result.
+
+    Args:
+        func (callable) taking ws_info followed by hashable arguments
+
+    Returns:
+        (callable) the coalescing wrapper
+    '''
+    @wraps(func)
+    def wrapper(ws_info, *args):
+        key = (func.__name__, ws_info['url'], args)
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                _INFLIGHT[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = func(ws_info, *args)
+            future.set_result(result)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            with _INFLIGHT_LOCK:
+                del _INFLIGHT[key]
+
+        return result
+
+    return wrapper
+
+
+# Parsed topology listings kept alongside the ETag the server sent for
+# them, so unchanged listings are answered by a bodyless 304
+_ETAG_CACHE = {}
+_ETAG_LOCK = Lock()
+
+
+def _etag_get(url, ws_info, params=None):
+    '''Issues a GET that revalidates any cached copy with If-None-Match
+
+    Args:
+        url (string) the API URL to fetch
+        ws_info (dict) UIM web services connection information
+        params (dict) optional query parameters
+
+    Returns:
+        (response, cached) tuple; cached holds the stored parsed result
+        when the server answered 304 Not Modified, otherwise None
+    '''
+    with _ETAG_LOCK:
+        entry = _ETAG_CACHE.get(url)
+
+    headers = _JSON_HEADERS
+    if entry:
+        headers = dict(_JSON_HEADERS)
+        headers['If-None-Match'] = entry[0]
+
+    response = _call('get', url, ws_info, params=params, headers=headers)
+    if response is not None and entry and response.status_code == 304:
+        return response, entry[1]
+
+    return response, None
+
+
+def _etag_store(url, response, value):
+    '''Remembers a parsed result against the ETag the server sent, if any
+
+    Args:
+        url (string) the API URL the result came from
+        response the requests response carrying the headers
+        value the parsed result to cache
+    '''
+    etag = response.headers.get('ETag')
+    if etag:
+        with _ETAG_LOCK:
+            _ETAG_CACHE[url] = (etag, value)
+
+
+# Slow-changing lookups (QOS source/target listings, group ids,
+# computer system ids) are cached in process for a few minutes
+_LOOKUP_CACHE = {}
+_LOOKUP_CACHE_LOCK = Lock()
+_LOOKUP_CACHE_TTL = 300
+
+
+def _lookup_cache_get(key):
+    '''Returns a cached lookup result or None when missing or expired
+
+    Args:
+        key (tuple) identifying the API call
+
+    Returns:
+        The cached value or None
+    '''
+    with _LOOKUP_CACHE_LOCK:
+        entry = _LOOKUP_CACHE.get(key)
+        if entry and monotonic() - entry[0] < _LOOKUP_CACHE_TTL:
+            return entry[1]
+        if entry:
+            del _LOOKUP_CACHE[key]
+
+    return None
+
+
+def _lookup_cache_put(key, value):
+    '''Stores a lookup result in the cache stamped with the current time
+
+    Args:
+        key (tuple) identifying the API call
+        value the result to cache
+    '''
+    with _LOOKUP_CACHE_LOCK:
+        _LOOKUP_CACHE[key] = (monotonic(), value)
+
+
+def clear_lookup_cache():
+    '''Drops all cached lookup results for callers that need fresh data'''
+    with _LOOKUP_CACHE_LOCK:
+        _LOOKUP_CACHE.clear()
+
+
+@lru_cache(maxsize=32)
+def _dumps_filter(filter_items):
+    '''Returns the serialized JSON body for an alarm filter
+
+    Scripts reuse the same small filter across many calls, so memoize
+    the dumps result keyed by the filter's sorted items.
+
+    Args:
+        filter_items (tuple) of sorted (key, value) filter pairs
+
+    Returns:
+        (string) JSON body for the filter
+    '''
+    return dumps(dict(filter_items))
+
+
+@lru_cache(maxsize=8)
+def _get_auth(user, password):
+    '''Returns a cached HTTPBasicAuth for the credential pair
+
+    Building the auth object (and its base64 header) once per credential
+    pair instead of once per request keeps it off the hot path.
+
+    Args:
+        user (string) UIM user with web service access
+        password (string) UIM user password
+
+    Returns:
+        (HTTPBasicAuth) reusable auth object
+    '''
+    return HTTPBasicAuth(user, password)
+
+
+def _get_session():
+    '''Returns the shared requests Session used for all API calls
+
+    The session keeps connections alive between calls through a pooled
+    HTTPAdapter so repeated requests skip the TCP and TLS handshakes,
+    and retries transient gateway errors with a short backoff.
+
+    Returns:
+        (Session) shared requests session
+    '''
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = Session()
+            # Retry transient failures in-band with exponential backoff
+            # so a flaky link returns data instead of an empty result.
+            # POST is deliberately absent: replaying a callback such as
+            # deploy_probe or createAlarm after a 5xx or read timeout
+            # could apply it twice, so POSTs only retry connect errors
+            retries = Retry(
+                total=5,
+                connect=3,
+                read=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(['GET', 'PUT', 'DELETE']),
+                raise_on_status=False
+            )
+            # Sized above the largest thread-pool fan-out in this tree so
+            # workers never discard pooled connections under load
+            adapter = _PinnedContextAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                pool_block=False,
+                max_retries=retries
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.verify = False
+            _SESSION = session
+
+    return _SESSION
+
+
+def _call(method, url, ws_info, params=None, body=None, json=None,
+          timeout=_TIMEOUT, headers=None, stream=False):
+    '''Issues a single API request on the shared session
+
+    Centralizes the auth, headers, timeout and transport error handling
+    that every endpoint previously repeated inline.
+
+    Args:
+        method (string) HTTP verb understood by requests
+        url (string) the API URL to call
+        ws_info (dict) UIM web services connection information
+        params (dict) optional query parameters
+        body (string) optional pre-serialized request body
+        json (dict) optional body serialized by requests
+        timeout (tuple or number) requests timeout for the call
+        headers (dict) optional replacement for the shared JSON headers
+        stream (bool) when True the body is not read eagerly
+
+    Returns:
+        The requests response, or None when the call failed in transport
+        after the adapter retries were spent
+    '''
+    try:
+        return _get_session().request(
+            method,
+            url,
+            auth=_get_auth(ws_info['user'], ws_info['password']),
+            timeout=timeout,
+            headers=headers if headers is not None else _JSON_HEADERS,
+            params=params,
+            data=body,
+            json=json,
+            stream=stream
+        )
+    except (ConnectionError, Timeout):
+        logging.exception('Failed to call %s %s', method.upper(), url)
+
+    return None
+
+
+@_coalesced
 def get_hubs(ws_info):
     '''Obtains a list of hubs from the UIM domain
 
@@ -25,40 +342,29 @@ def get_hubs(ws_info):
     Returns:
         (dict) containing list of UIM hubs
     '''
-    url = ws_info['url'] + '/hubs'
-    headers = {
-        'content-type': 'application/json',
-        'accept': 'application/json'
-    }
-    params = {
-        'inCurrentDomain': 'true'
-    }
+    url = f"{ws_info['url']}/hubs"
+    results = {}
+    response, cached = _etag_get(url, ws_info, params=_DOMAIN_PARAMS)
+    if cached is not None:
+        return cached
 
-    results = loads('{}')
-    try:
-        response = get(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers,
-            params=params
+    if response is not None:
+        logging.debug(
+            'Get hub response status %s with %s bytes',
+            response.status_code,
+            len(response.content)
         )
-        logging.debug('Get hub response was %s', response.text)
-        if response.status_code == 200:
-            hubs = loads(response.text)
+        if response.status_code == 200 and response.content:
+            hubs = response.json()
             results = hubs['hub']
+            _etag_store(url, response, results)
         else:
             logging.error('Failed to get hubs')
 
-    except ConnectionError:
-        logging.exception('Failed to call UIM hub API')
-
     return results
 
 
+@_coalesced
 def get_robots(ws_info, hub):
     '''Obtains a list of robots assigned to the UIM hub
 
@@ -75,40 +381,29 @@ def get_robots(ws_info, hub):
     Returns:
         (dict) containing list of UIM robots
     '''
-    url = ws_info['url'] + '/hubs/' + ws_info['domain'] + '/' + hub + '/' + 'robots'
-    headers = {
-        'content-type': 'application/json',
-        'accept': 'application/json'
-    }
-    params = {
-        'inCurrentDomain': 'true'
-    }
+    url = f"{ws_info['url']}/hubs/{ws_info['domain']}/{quote(hub, safe='')}/robots"
+    results = {}
+    response, cached = _etag_get(url, ws_info, params=_DOMAIN_PARAMS)
+    if cached is not None:
+        return cached
 
-    results = loads('{}')
-    try:
-        response = get(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers,
-            params=params
+    if response is not None:
+        logging.debug(
+            'Get robot response status %s with %s bytes',
+            response.status_code,
+            len(response.content)
         )
-        logging.debug('Get robot response was %s', response.text)
-        if response.status_code == 200:
-            robots = loads(response.text)
+        if response.status_code == 200 and response.content:
+            robots = response.json()
             results = robots['robot']
+            _etag_store(url, response, results)
         else:
             logging.error('Failed get robots')
 
-    except ConnectionError:
-        logging.exception('Failed to call UIM robots API')
-
     return results
 
 
+@_coalesced
 def get_probes(ws_info, hub, robot):
     '''Obtain a list of probes on a UIM robot
 
@@ -126,36 +421,68 @@ def get_probes(ws_info, hub, robot):
     Returns:
         (dict) containing list of UIM probes
     '''
-    url = ws_info['url'] + '/hubs/' + ws_info['domain'] + '/' + hub + '/' + robot
-    headers = {
-        'content-type': 'application/json',
-        'accept': 'application/json'
-    }
-
-    results = loads('{}')
-    try:
-        response = get(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers
-        )
-        if response.status_code == 200:
-            probes = loads(response.text)
-            results = probes['probes']
+    url = f"{ws_info['url']}/hubs/{ws_info['domain']}/{quote(hub, safe='')}/{quote(robot, safe='')}"
+
+    results = {}
+    response = _call('get', url, ws_info)
+    if response is not None:
+        if response.status_code == 200 and response.content:
+            probes = response.json()
+            results = probes.get('probes')
+            if results is None:
+                logging.info('No probes returned from call UIM probes API')
+                results = {}
         else:
             logging.error('Failed to get probes')
 
-    except ConnectionError:
-        logging.exception('Failed to call UIM probes API')
+    return results
+
 
-    except KeyError:
-        logging.exception('No probes returned from call UIM probes API')
+def get_all_probes(ws_info, max_workers=32):
+    '''Obtains every probe on every robot in the domain concurrently
 
-    return results
+    Walks hubs, then robots per hub, then probes per robot, fanning the
+    per-robot calls out on a thread pool that shares the pooled session
+    instead of crawling the hierarchy serially.
+
+    Args:
+        ws_info (dict) containing
+            user (string) UIM user with web service access
+            password (string) UIM user password
+            url (string) UIM REST API URL
+            domain (string) UIM domain name
+        max_workers (number) of REST calls made concurrently
+
+    Returns:
+        (list) of probe dicts, each enriched with hub and robot keys
+    '''
+    all_probes = []
+    hubs = get_hubs(ws_info)
+    if not hubs:
+        return all_probes
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        robot_lists = executor.map(
+            lambda hub: (hub['name'], get_robots(ws_info, hub['name'])),
+            hubs
+        )
+        pairs = [
+            (hub_name, robot['name'])
+            for hub_name, robots in robot_lists
+            for robot in robots
+        ]
+
+        probe_lists = executor.map(
+            lambda pair: (pair, get_probes(ws_info, pair[0], pair[1])),
+            pairs
+        )
+        for (hub_name, robot_name), probes in probe_lists:
+            for probe in probes:
+                probe['hub'] = hub_name
+                probe['robot'] = robot_name
+                all_probes.append(probe)
+
+    return all_probes
 
 
 def get_alarms(ws_info, alarm_filter):
@@ -176,37 +503,30 @@ def get_alarms(ws_info, alarm_filter):
     Returns:
         (dict) of matching alarms
     '''
-    url = ws_info['url'] + '/alarms'
-    headers = {
-        'content-type': 'application/json',
-        'accept': 'application/json'
-    }
-
-    results = loads('{}')
-    try:
-        response = post(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers,
-            data=dumps(alarm_filter)
+    url = f"{ws_info['url']}/alarms"
+
+    results = {}
+    response = _call(
+        'post',
+        url,
+        ws_info,
+        body=_dumps_filter(tuple(sorted(alarm_filter.items())))
+    )
+    if response is not None:
+        logging.debug(
+            'Get alarms response status %s with %s bytes',
+            response.status_code,
+            len(response.content)
         )
-        logging.debug('Get alarms response was %s', response.text)
-        if response.status_code == 200:
-            alarms = loads(response.text)
-            results = alarms['alarm']
+        if response.status_code == 200 and response.content:
+            alarms = response.json()
+            results = alarms.get('alarm')
+            if results is None:
+                logging.info('No alarms returned from filtered alarm API call')
+                results = {}
         else:
             logging.error('Failed to get alarms')
 
-    except ConnectionError:
-        logging.exception('Failed to call UIM alarm API')
-
-    except KeyError:
-        logging.exception('No alarms returned from filtered alarm API call')
-
     return results
 
 
@@ -228,42 +548,18 @@ def remove_robot(ws_info, hub, hub_robot, robot):
     Returns:
         True if successfully in removing the robot, False if not
     '''
-    url = ws_info['url'] + '/probe/' + ws_info['domain'] + '/' + hub + '/' + \
-        hub_robot + '/hub/callback/removerobot'
-    headers = {
-        'content-type': 'application/json',
-        'accept': 'application/json'
-    }
-    data = {
-        'parameters' : {
-            'name': 'name',
-            'type': 'string',
-            'value': ''
-        }
-    }
-    data['parameters']['value'] = robot
-
+    url = f"{ws_info['url']}/probe/{ws_info['domain']}/{quote(hub, safe='')}/" \
+        f"{quote(hub_robot, safe='')}/hub/callback/removerobot"
     result = False
-    try:
-        response = post(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers,
-            data=dumps(data)
-        )
-        logging.debug('The response from callback removerobot was %s', response.text)
+    response = _call('post', url, ws_info, body=_NAME_CB_TMPL % dumps(robot))
+    if response is not None:
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('The response from callback removerobot was %s', response.text)
         if response.status_code == 200:
             result = True
         else:
             logging.error('Failed to remove robot %s', robot)
 
-    except ConnectionError:
-        logging.exception('Failed to callback removerobot API')
-
     return result
 
 
@@ -281,33 +577,51 @@ def acknowledge_alarm(ws_info, alarm_id):
     Returns
         True if successful, False if not
     '''
-    url = ws_info['url'] + '/alarms/' + alarm_id + '/ack'
-    headers = {
-        'content-type': 'application/json',
-        'accept': 'application/json'
-    }
+    url = f"{ws_info['url']}/alarms/{quote(alarm_id, safe='')}/ack"
 
     result = False
-    try:
-        response = put(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers
-        )
+    response = _call('put', url, ws_info)
+    if response is not None:
         if response.status_code == 204:
             logging.info('successfully close alarm with id %s', alarm_id)
             result = True
 
-    except ConnectionError:
-        logging.exception('Failed to call acknowledge alarm API for %s', alarm_id)
-
     return result
 
 
+def acknowledge_alarms(ws_info, alarm_ids, max_workers=16):
+    '''Acknowledges / closes a batch of UIM alarms
+
+    The REST API has no bulk acknowledge call, so the batch is pipelined
+    over the pooled keep-alive session with a thread pool instead of
+    paying one cold connection per alarm.
+
+    Args:
+        ws_info (dict) containing
+            user (string) UIM user with web service access
+            password (string) UIM user password
+            url (string) UIM REST API URL
+        alarm_ids (list) of alarm ids to acknowledge
+        max_workers (number) of alarms acknowledged concurrently
+
+    Returns:
+        (list) of the alarm ids that were successfully acknowledged
+    '''
+    acknowledged = []
+    if not alarm_ids:
+        return acknowledged
+
+    workers = min(max_workers, len(alarm_ids))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        outcomes = executor.map(partial(acknowledge_alarm, ws_info), alarm_ids)
+        for alarm_id, result in zip(alarm_ids, outcomes):
+            if result:
+                acknowledged.append(alarm_id)
+
+    return acknowledged
+
+
+@_coalesced
 def get_qos_targets(ws_info, source, qos):
     '''Returns a list of targets for a given source and QOS
 
@@ -325,39 +639,27 @@ def get_qos_targets(ws_info, source, qos):
         targets (list) of targets for QOS on source
 
     '''
-    url = ws_info['url'] + '/qos/targets/' + qos + '/' + source
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
+    url = f"{ws_info['url']}/qos/targets/{quote(qos, safe='')}/{quote(source, safe='')}"
+    cache_key = ('targets', url)
+    cached = _lookup_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     targets = []
 
-    try:
-        response = get(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers
-        )
+    response = _call('get', url, ws_info)
+    if response is not None:
         logging.debug(
-            'The response for get targets of QOS %s for source %s was %s',
+            'The response for get targets of QOS %s for source %s was status %s with %s bytes',
             qos,
             source,
-            response.text
+            response.status_code,
+            len(response.content)
         )
-        if response.status_code == 200 and not response.text == '{}':
-            results = loads(response.text)
+        if response.status_code == 200 and response.content not in (b'', b'{}'):
+            results = response.json()
             targets = results['target']
-    except ConnectionError:
-        logging.exception(
-            'Failed API call to retrieve list of targets for qos %s from source %s',
-            qos,
-            source
-        )
-
+            _lookup_cache_put(cache_key, targets)
     return targets
 
 
@@ -379,45 +681,56 @@ def get_single_qos_value(ws_info, qos, source, target, start, end):
     Returns:
         value (number) single data value if found or None
     '''
-    url = ws_info['url'] + '/qos/data/name/' + qos + \
-        '/' + source + '/' + target + '/' + start + '/' + \
-        end + '/1'
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
-    value = None
-    try:
-        response = get(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers
-        )
+    data = get_qos_range(ws_info, qos, source, target, start, end, 1)
+    if data:
+        return data[0].get('samplevalue')
+
+    return None
+
+
+def get_qos_range(ws_info, qos, source, target, start, end, maxrows):
+    '''Returns up to maxrows raw qos samples between the start and end times
+
+    API Link: https://docops.ca.com/ca-unified-infrastructure-management-probes/ga/en/probe-development-tools/restful-web-services/call-reference/qos-calls#QoSCalls-GetRawQoSData
+
+    Args:
+        ws_info (dict) containing
+            user (string) UIM user with web service access
+            password (string) UIM user password
+            url (string) UIM REST API URL
+        qos (string) name of the QOS metrics to retrieve
+        source (string) name of the device to get targets for
+        target (string) UIM target or component to retrieve the QOS data for
+        start (string) beginning of time to retrieve qos format yyyyddMMHHmm
+        end (string) end of time to retrieve qos format yyyyddMMHHmm
+        maxrows (number) maximum number of samples to return
+
+    Returns:
+        data (list) of raw sample dicts, empty when none were found
+    '''
+    url = (f"{ws_info['url']}/qos/data/name/{quote(qos, safe='')}/"
+           f"{quote(source, safe='')}/{quote(target, safe='')}/"
+           f'{start}/{end}/{maxrows}')
+    data = []
+    response = _call('get', url, ws_info)
+    if response is not None:
 
         logging.debug(
-            'The response for get %s QOS for %s device was %s',
+            'The response for get %s QOS for %s device was status %s with %s bytes',
             qos,
             source,
-            response.text
+            response.status_code,
+            len(response.content)
         )
-        if response.status_code == 200 and not response.text == '{}':
-            result = loads(response.text)
-            value = result['data'][0]['samplevalue']
+        # Short-circuit empty bodies before paying for a JSON parse
+        if response.status_code == 200 and response.content not in (b'', b'{}'):
+            result = response.json()
+            data = result.get('data') or []
 
-    except ConnectionError:
-        logging.exception(
-            'Failed to call API to get QOS value for %s QOS with %s source',
-            qos,
-            source
-        )
-
-    return value
+    return data
 
 
+@_coalesced
 def get_qos_sources(ws_info, qos):
     '''Returns a list of sources for a given QOS name
 
@@ -434,37 +747,37 @@ def get_qos_sources(ws_info, qos):
         sources (list) of targets for QOS on source
 
     '''
-    url = ws_info['url'] + '/qos/sources/' + qos
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
+    url = f"{ws_info['url']}/qos/sources/{quote(qos, safe='')}"
+    cache_key = ('sources', url)
+    cached = _lookup_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
 
     sources = []
-    try:
-        response = get(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers
+    response = _call('get', url, ws_info)
+    if response is not None:
+        logging.debug(
+            'The response for get QOS sources was status %s with %s bytes',
+            response.status_code,
+            len(response.content)
         )
-        logging.debug('The response for get QOS sources was %s', response.text)
-        if response.status_code == 200 and not response.text == '{}':
-            results = loads(response.text)
+        if response.status_code == 200 and response.content not in (b'', b'{}'):
+            results = response.json()
             sources = results['qos-source']
-
-    except ConnectionError:
-        logging.exception('Failed to call API to get sources for %s QOS', qos)
+            _lookup_cache_put(cache_key, sources)
 
     return sources
 
 
+@lru_cache(maxsize=4096)
 def _get_ip(device):
     '''Obtains the IP address of device
 
+    Resolutions are cached for the life of the process since a device
+    rarely changes address mid run; long-running callers can call
+    _get_ip.cache_clear() to re-resolve.
+
     Args:
         device (string) name to get an IP address for
 
@@ -499,37 +812,32 @@ def get_comp_sys_ids(ws_info, device):
     Returns:
         cs_id (list) of the computer system id(s)
     '''
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
+
+    cache_key = ('cs_ids', ws_info['url'], device)
+    cs_id = _lookup_cache_get(cache_key)
+    if cs_id is not None:
+        return cs_id
 
     cs_id = []
     ip_addr = _get_ip(device)
     if ip_addr:
-        url = ws_info['url'] + '/computer_systems/cs_ip/' + ip_addr
-
-        try:
-            response = get(
-                url,
-                auth=HTTPBasicAuth(
-                    ws_info['user'],
-                    ws_info['password']
-                ),
-                verify=False,
-                headers=headers)
+        url = f"{ws_info['url']}/computer_systems/cs_ip/{ip_addr}"
 
+        response = _call('get', url, ws_info)
+        if response is not None:
             logging.debug(
-                'The response from the get computer system id by IP was %s',
-                response.text
+                'The response from the get computer system id by IP was status %s with %s bytes',
+                response.status_code,
+                len(response.content)
             )
             if response.status_code == 200:
-                results = loads(response.text)
+                results = response.json()
 
                 # UIM sometimes has duplicate devices not correlated by discovery_server
-                for computer_system in results['computer_system']:
-                    cs_id.append(computer_system['cs_id'])
-
+                cs_id = [
+                    computer_system['cs_id']
+                    for computer_system in results.get('computer_system', ())
+                ]
                 logging.info(
                     'Successfully got the computer system id for %s by IP as %s',
                     device,
@@ -540,34 +848,22 @@ def get_comp_sys_ids(ws_info, device):
                     device,
                     response.status_code
                 )
-
-        except ConnectionError:
-            logging.exception('Failed to call UIM computer system id by IP API')
-
-        except KeyError:
-            logging.exception('No computer systems found by IP for name %s', device)
     else:
-        url = ws_info['url'] + '/computer_systems/cs_name/' + device
+        url = f"{ws_info['url']}/computer_systems/cs_name/{quote(device, safe='')}"
 
-        try:
-            response = get(
-                url,
-                auth=HTTPBasicAuth(
-                    ws_info['user'],
-                    ws_info['password']
-                ),
-                verify=False,
-                headers=headers
-            )
+        response = _call('get', url, ws_info)
+        if response is not None:
             logging.debug(
-                'The response from the get computer system id by name was %s',
-                response.text
+                'The response from the get computer system id by name was status %s with %s bytes',
+                response.status_code,
+                len(response.content)
             )
             if response.status_code == 200:
-                results = loads(response.text)
-                for computer_system in results['computer_system']:
-                    cs_id.append(computer_system['cs_id'])
-
+                results = response.json()
+                cs_id = [
+                    computer_system['cs_id']
+                    for computer_system in results.get('computer_system', ())
+                ]
                 logging.info(
                     'Successfully got the computer system id for %s by name as %s',
                     device,
@@ -581,15 +877,32 @@ def get_comp_sys_ids(ws_info, device):
                     response.status_code
                 )
 
-        except ConnectionError:
-            logging.exception('Failed to call UIM computer system id by name API')
-
-        except KeyError:
-            logging.exception('No computer systems found by name for name %s', device)
+    if cs_id:
+        _lookup_cache_put(cache_key, cs_id)
 
     return cs_id
 
 
+def get_comp_sys_ids_bulk(ws_info, devices, max_workers=16):
+    '''Obtains computer system ids for many devices concurrently
+
+    Resolves DNS and queries the API for each device on a thread pool
+    sharing the pooled session instead of looping device by device.
+
+    Args:
+        ws_info (dict) containing
+            user (string) UIM user with web service access
+            password (string) UIM user password
+            url (string) UIM REST API URL
+        devices (list) of device names to get computer system ids for
+        max_workers (number) of lookups made concurrently
+
+    Returns:
+        (dict) mapping each device to its list of computer system ids
+    '''
+    return _fan_out(partial(get_comp_sys_ids, ws_info), devices, max_workers)
+
+
 def nis_cache_clean(ws_info, robot_address):
     '''Clears the robot niscache using the _nis_cache_clean callback
 
@@ -606,43 +919,20 @@ def nis_cache_clean(ws_info, robot_address):
     Returns:
         True if successfull in running cleaning the nis cache, False if not
     '''
-    url = ws_info['url'] + '/probe' + robot_address + '/controller/callback/_nis_cache_clean'
-    headers = {
-        'content-type': 'application/json',
-        'accept': 'application/json'
-    }
-    data = {
-        'parameters' : {
-            'name': 'robot',
-            'type': 'string',
-            'value': ''
-        }
-    }
-    found = search(r'/.+/.+/(.+)$', robot_address)
+    url = f"{ws_info['url']}/probe{quote(robot_address)}/controller/callback/_nis_cache_clean"
+    found = _ROBOT_RE.search(robot_address)
     robot = found.group(1)
-    data['parameters']['value'] = robot
 
     result = False
-    try:
-        response = post(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers,
-            data=dumps(data)
-        )
-        logging.debug('The response from callback _nis_cache_clean was %s', response.text)
+    response = _call('post', url, ws_info, body=_ROBOT_CB_TMPL % dumps(robot))
+    if response is not None:
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('The response from callback _nis_cache_clean was %s', response.text)
         if response.status_code == 200:
             result = True
         else:
             logging.error('Failed to clean nis cache for robot %s', robot_address)
 
-    except ConnectionError:
-        logging.exception('Failed to callback _nis_cache_clean API')
-
     return result
 
 
@@ -662,40 +952,19 @@ def reset_device_id_and_restart(ws_info, robot_address):
     Returns:
         True if successfull in reseting the device id and restarting, False if not
     '''
-    url = ws_info['url'] + '/probe' + robot_address + \
+    url = f"{ws_info['url']}/probe{quote(robot_address)}" \
         '/controller/callback/_reset_device_id_and_restart'
-    headers = {
-        'content-type': 'application/json',
-        'accept': 'application/json'
-    }
-    data = {
-        'parameters' : {
-            'name': 'robot',
-            'type': 'string',
-            'value': ''
-        }
-    }
-
-    found = search(r'/.+/.+/(.+)$', robot_address)
+    found = _ROBOT_RE.search(robot_address)
     robot = found.group(1)
-    data['parameters']['value'] = robot
 
     result = False
-    try:
-        response = post(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers,
-            data=dumps(data)
-        )
-        logging.debug(
-            'The response from callback _reset_device_id_and_restart was %s',
-            response.text
-        )
+    response = _call('post', url, ws_info, body=_ROBOT_CB_TMPL % dumps(robot))
+    if response is not None:
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                'The response from callback _reset_device_id_and_restart was %s',
+                response.text
+            )
         if response.status_code == 200:
             result = True
         else:
@@ -704,12 +973,64 @@ def reset_device_id_and_restart(ws_info, robot_address):
                 robot_address
             )
 
-    except ConnectionError:
-        logging.exception('Failed to callback _reset_device_id_and_restart API')
-
     return result
 
 
+def _fan_out(call, items, max_workers):
+    '''Runs a one-argument call over items on a thread pool
+
+    Args:
+        call (callable) invoked once per item
+        items (list) of arguments to pass
+        max_workers (number) of calls made concurrently
+
+    Returns:
+        (dict) mapping each item to its call result
+    '''
+    results = {}
+    if not items:
+        return results
+
+    workers = min(max_workers, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for item, outcome in zip(items, executor.map(call, items)):
+            results[item] = outcome
+
+    return results
+
+
+def bulk_nis_cache_clean(ws_info, robot_addresses, max_workers=8):
+    '''Clears the niscache on many robots concurrently
+
+    Args:
+        ws_info (dict) UIM web services connection information
+        robot_addresses (list) of UIM robot addresses
+        max_workers (number) of callbacks run concurrently
+
+    Returns:
+        (dict) mapping each robot address to True or False
+    '''
+    return _fan_out(partial(nis_cache_clean, ws_info), robot_addresses, max_workers)
+
+
+def bulk_reset_device_id_and_restart(ws_info, robot_addresses, max_workers=8):
+    '''Resets the device id and restarts many robots concurrently
+
+    Args:
+        ws_info (dict) UIM web services connection information
+        robot_addresses (list) of UIM robot addresses
+        max_workers (number) of callbacks run concurrently
+
+    Returns:
+        (dict) mapping each robot address to True or False
+    '''
+    return _fan_out(
+        partial(reset_device_id_and_restart, ws_info),
+        robot_addresses,
+        max_workers
+    )
+
+
 def push_pkg(ws_info, ade, package, hub, robot):
     '''Pushes package to robot
 
@@ -729,13 +1050,9 @@ def push_pkg(ws_info, ade, package, hub, robot):
     Returns:
         True if job initiated successfully, False otherwise
     '''
-    robot_address = '/' + ws_info['domain'] + '/' + hub + '/' + robot
-    url = ws_info['url'] + '/probe' + ade \
-        + '/automated_deployment_engine/callback/deploy_probe'
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
+    robot_address = f"/{ws_info['domain']}/{hub}/{robot}"
+    url = f"{ws_info['url']}/probe{quote(ade)}" \
+        '/automated_deployment_engine/callback/deploy_probe'
     data = {
         'parameters': [
             {'name': 'robot', 'type': 'string', 'value': ''},
@@ -746,18 +1063,10 @@ def push_pkg(ws_info, ade, package, hub, robot):
     data['parameters'][1]['value'] = package
 
     result = False
-    try:
-        response = post(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers,
-            data=dumps(data)
-        )
-        logging.debug('The ADE package deploy response %s', response.text)
+    response = _call('post', url, ws_info, json=data)
+    if response is not None:
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('The ADE package deploy response %s', response.text)
         if response.status_code == 200:
             result = True
         else:
@@ -766,9 +1075,6 @@ def push_pkg(ws_info, ade, package, hub, robot):
                 package,
                 robot
             )
-    except ConnectionError:
-        logging.exception('Failed to call deploy probe API callback')
-
     return result
 
 
@@ -797,35 +1103,24 @@ def create_contact(ws_info, contact_data):
         Contact ID of the user created or None on failure
     '''
 
-    url = ws_info['url'] + '/contacts'
-    headers = {
-        'content-type': 'application/json',
-        'accept': 'application/json'}
+    url = f"{ws_info['url']}/contacts"
 
     contact_id = None
-    try:
-        response = post(
-            url, 
-            auth=HTTPBasicAuth(ws_info['user'], ws_info['password']),
-            verify=False,
-            headers=headers,
-            data=dumps(contact_data)
-        )
-
-        if response.status_code == 200:
-            json_returned = loads(response.text)
-            contact_id = json_returned['contactId']
-        else:
-            logging.warning(
-                'Unable to create contact %s, failed with status code %s',
-                contact_data['loginName'],
-                response.status_code
-            )
+    response = _call('post', url, ws_info, json=contact_data)
+    if response is not None:
+        try:
+            if response.status_code == 200:
+                json_returned = response.json()
+                contact_id = json_returned['contactId']
+            else:
+                logging.warning(
+                    'Unable to create contact %s, failed with status code %s',
+                    contact_data['loginName'],
+                    response.status_code
+                )
 
-    except ConnectionError:
-        logging.exception('Failed to call API to create contact %s', contact_data['loginName'])
-    except KeyError:
-        logging.exception('No contact id was returned for creation of %s', contact_data['loginName'])
+        except KeyError:
+            logging.exception('No contact id was returned for creation of %s', contact_data['loginName'])
 
     return contact_id
 
@@ -848,14 +1143,9 @@ def remove_mm_schedule(ws_info, schedule_id, uim_ws_mm_probe):
         Nothing
     '''
 
-    try:
-        mm_del_schedule_url = uim_ws_mm_probe + '/delete_schedule/' + schedule_id
-        mm_del_resp = delete(
-            mm_del_schedule_url,
-            auth=HTTPBasicAuth(ws_info['user'], ws_info['password']),
-            verify=False,
-            timeout=30
-        )
+    mm_del_schedule_url = f'{uim_ws_mm_probe}/delete_schedule/{schedule_id}'
+    mm_del_resp = _call('delete', mm_del_schedule_url, ws_info, timeout=30)
+    if mm_del_resp is not None:
         if mm_del_resp.status_code == 204:
             logging.info('Successfully deleted schedule id: %s', schedule_id)
         else:
@@ -865,11 +1155,6 @@ def remove_mm_schedule(ws_info, schedule_id, uim_ws_mm_probe):
                 mm_del_resp.status_code
             )
 
-    except ConnectionError:
-        logging.exception('Failed to call delete schedule API.')
-    except Timeout:
-        logging.exception('Timed out waiting for delete maintenance schedule')
-
     return
 
 
@@ -895,11 +1180,7 @@ def create_group(ws_info, pgrp_id, grp_name, grp_desc, grp_type):
     '''
 
     grp_id = None
-    url = ws_info['url'] + '/group'
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
+    url = f"{ws_info['url']}/group"
     data = {}
     data['groupType'] = str(grp_type)
     data['parentGroupId'] = str(pgrp_id)
@@ -909,21 +1190,16 @@ def create_group(ws_info, pgrp_id, grp_name, grp_desc, grp_type):
     else:
         data['desc'] = grp_desc
 
-    try:
-        response = post(
-            url,
-            auth=HTTPBasicAuth(ws_info['user'], ws_info['password']),
-            verify=False,
-            headers=headers,
-            data=dumps(data)
-        )
+    response = _call('post', url, ws_info, json=data)
+    if response is not None:
 
-        logging.debug(
-            'The response from the group creation was %s',
-            response.text
-        )
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                'The response from the group creation was %s',
+                response.text
+            )
         if response.status_code == 200:
-            json_resp = loads(response.text)
+            json_resp = response.json()
             grp_id = json_resp['groupId']
             logging.info(
                 'Successfully created group %s with group id %s',
@@ -935,12 +1211,6 @@ def create_group(ws_info, pgrp_id, grp_name, grp_desc, grp_type):
                 'Failed to connect to UIM API to create group with status code %s',
                 response.status_code
             )
-    except ConnectionError:
-        logging.exception(
-            'Failed to call the UIM API to create the group %s',
-            grp_name
-        )
-
     return grp_id
 
 
@@ -964,28 +1234,20 @@ def add_grp_member(ws_info, grp_id, new_mem):
     '''
 
     logging.info('Adding %s to group %s', new_mem, grp_id)
-    url = ws_info['url'] + '/group/members/' + str(grp_id)
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'}
+    url = f"{ws_info['url']}/group/members/{grp_id}"
     data = {}
     data['cs'] = new_mem
 
     result = False
 
-    try:
-        response = post(
-            url,
-            auth=HTTPBasicAuth(ws_info['user'], ws_info['password']),
-            verify=False,
-            headers=headers,
-            data=dumps(data)
-        )
+    response = _call('post', url, ws_info, json=data)
+    if response is not None:
 
-        logging.debug(
-            'The response from the add group members was %s',
-            response.text
-        )
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                'The response from the add group members was %s',
+                response.text
+            )
         if response.status_code == 204:
             logging.info(
                 'Successfully added members to groupid %s', 
@@ -999,12 +1261,52 @@ def add_grp_member(ws_info, grp_id, new_mem):
                 response.status_code
         )
 
-    except ConnectionError:
-        logging.exception(
-            'Failed to connect to UIM API to add device %s to group id %s',
-            new_mem,
-            grp_id
-    )
+    return result
+
+
+def add_grp_members(ws_info, grp_id, new_mems):
+    '''Adds a list of new members to the group with id specified
+
+    The endpoint accepts an array of cs_ids, so one POST covers the
+    whole list instead of a round trip per member.
+
+    API Link: https://docops.ca.com/ca-unified-infrastructure-management-probes/ga/en/probe-development-tools/restful-web-services/call-reference/group-resource-calls#GroupResourceCalls-AddGroupMembers
+
+    Args:
+        ws_info (list) of CA UIM Web Services location and credentials
+            user (string) UIM user with web service access
+            password (string) UIM user password
+            url (string) UIM REST API URL
+            domain (string) UIM domain name
+        grp_id (integer) id of the group we are adding the members to
+        new_mems (list) cs_ids of the new members to add
+
+    Returns:
+        True if successful
+        False if it fails
+    '''
+
+    logging.info('Adding %s members to group %s', len(new_mems), grp_id)
+    url = f"{ws_info['url']}/group/members/{grp_id}"
+    data = {}
+    data['cs'] = new_mems
+
+    result = False
+
+    response = _call('post', url, ws_info, json=data)
+    if response is not None:
+        if response.status_code == 204:
+            logging.info(
+                'Successfully added members to groupid %s',
+                grp_id
+            )
+            result = True
+        else:
+            logging.error(
+                'Failed to connect to UIM API to add members to group %s, status code %s',
+                grp_id,
+                response.status_code
+            )
 
     return result
 
@@ -1025,26 +1327,24 @@ def group_exists(ws_info, grp_name):
         If the group does not exists or other failure None
     """
 
-    url = ws_info['url'] + '/group/' + grp_name + '/exists'
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'}
-    grp_id = None
-    try:
-        response = get(
-            url,
-            auth=HTTPBasicAuth(ws_info['user'], ws_info['password']),
-            verify=False,
-            headers=headers
-        )
+    url = f"{ws_info['url']}/group/{quote(grp_name, safe='')}/exists"
+    cache_key = ('group_exists', url)
+    grp_id = _lookup_cache_get(cache_key)
+    if grp_id is not None:
+        return grp_id
 
-        logging.debug(
-            'The response from the group exists by name was %s',
-            response.text
-        )
+    response = _call('get', url, ws_info)
+    if response is not None:
+
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                'The response from the group exists by name was %s',
+                response.text
+            )
         if response.status_code == 200:
-            data = loads(response.text)
+            data = response.json()
             grp_id = data['group']['groupId']
+            _lookup_cache_put(cache_key, grp_id)
             logging.info(
                 'Successfully got the group id for %s by name as %s',
                 grp_name,
@@ -1056,9 +1356,6 @@ def group_exists(ws_info, grp_name):
                 grp_name,
                 response.status_code
             )
-    except ConnectionError:
-        logging.exception('Group exists API call failure with URL %s', url)
-
     return grp_id
 
 
@@ -1079,36 +1376,20 @@ def os_info(ws_info, hub, robot):
     Returns:
         Robot OS e.g. Windows or Linux
     '''
-    robot_address = '/' + ws_info['domain'] + '/' + hub + '/' + robot
-    url = ws_info['url'] + '/probe' + robot_address \
-        + '/controller/callback/os_info'
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
+    robot_address = f"/{ws_info['domain']}/{hub}/{robot}"
+    url = f"{ws_info['url']}/probe{quote(robot_address)}/controller/callback/os_info"
 
     data = {}
     oper_sys = None
-    try:
-        response = post(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers,
-            data=dumps(data)
-        )
-        logging.debug('The os_info response %s', response.text)
+    response = _call('post', url, ws_info, json=data)
+    if response is not None:
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('The os_info response %s', response.text)
         if response.status_code == 200:
-            results = loads(response.text)
+            results = response.json()
             oper_sys = results['entry'][0]['value']['$']
         else:
             logging.error('Failed to make os_info call for %s', robot_address)
-    except ConnectionError:
-        logging.exception('Failed to call os_info probe API callback')
-
     return oper_sys
 
 def is_process_running(ws_info, hub, robot, process):
@@ -1129,13 +1410,8 @@ def is_process_running(ws_info, hub, robot, process):
     Returns:
         True if process is found, False otherwise
     '''
-    robot_address = '/' + ws_info['domain'] + '/' + hub + '/' + robot
-    url = ws_info['url'] + '/probe' + robot_address \
-        + '/processes/callback/list_processes'
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
+    robot_address = f"/{ws_info['domain']}/{hub}/{robot}"
+    url = f"{ws_info['url']}/probe{quote(robot_address)}/processes/callback/list_processes"
 
     data = {
         'parameters': [
@@ -1144,26 +1420,27 @@ def is_process_running(ws_info, hub, robot, process):
     }
     data['parameters'][0]['value'] = process
     running = False
-    try:
-        response = post(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers,
-            data=dumps(data)
-        )
-        logging.debug('The list_processes response %s', response.text)
+    response = _call('post', url, ws_info, json=data, stream=True)
+    if response is not None:
         if response.status_code == 200:
-            if process in response.text:
-                running = True
+            # Scan the listing as it streams in and stop reading on the
+            # first hit instead of decoding the whole body up front
+            tail = ''
+            for chunk in response.iter_content(
+                    chunk_size=8192, decode_unicode=True):
+                if not isinstance(chunk, str):
+                    chunk = chunk.decode('utf-8', 'replace')
+                if process in tail + chunk:
+                    running = True
+                    break
+                # Accumulate the window across chunks; decoded chunks
+                # can be arbitrarily short, so slicing the chunk alone
+                # could drop a name spanning three or more of them
+                tail = (tail + chunk)[-(len(process) - 1):] \
+                    if len(process) > 1 else ''
         else:
             logging.error('Failed to make list_processes call for %s', robot_address)
-    except ConnectionError:
-        logging.exception('Failed to call list_processes probe API callback')
-
+        response.close()
     return running
 
 
@@ -1184,31 +1461,16 @@ def set_custom(ws_info, nimid, attr):
     Returns:
         True if successful, False if fails    
     '''
-    headers = {
-        'content-type': 'application/json',
-        'accept': 'application/json'
-    }
-    url = ws_info['url'] + '/alarms/' + nimid + '/set_custom_property'
+    url = f"{ws_info['url']}/alarms/{quote(nimid, safe='')}/set_custom_property"
 
     result = False
-    try:
-        response = post(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers,
-            data=dumps(attr)
-        )
-        logging.debug('The response from set_custom_property was %s', response.text)
+    response = _call('post', url, ws_info, json=attr)
+    if response is not None:
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('The response from set_custom_property was %s', response.text)
         if response.status_code == 204:
             result = True
 
-    except ConnectionError:
-        logging.exception('Failed to call set_custom_property')
-
     return result
 
 def assign_alarm(ws_info, nimid, assignee):
@@ -1229,29 +1491,14 @@ def assign_alarm(ws_info, nimid, assignee):
         True if successful, False if fails
 
     '''
-    headers = {
-        'content-type': 'application/json',
-        'accept': 'application/json'
-    }
-    url = ws_info['url'] + '/alarms/' + nimid + '/assign/' + assignee
+    url = f"{ws_info['url']}/alarms/{quote(nimid, safe='')}/assign/{quote(assignee, safe='')}"
 
     result = False
-    try:
-        response = put(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers
-        )
+    response = _call('put', url, ws_info)
+    if response is not None:
         if response.status_code == 204:
             result = True
 
-    except ConnectionError:
-        logging.exception('Failed to call assign')
-
     return result
 
 
@@ -1269,26 +1516,13 @@ def add_group_account(ws_info, grp_id, acc_id):
     Returns:
         Nothing
     '''
-    url = ws_info['url'] + '/group/accounts/' + grp_id
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
+    url = f"{ws_info['url']}/group/accounts/{grp_id}"
 
     data = {'groupAccount': [1]}
     data['groupAccount'][0] = acc_id
 
-    try:
-        response = post(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers,
-            data=dumps(data)
-        )
+    response = _call('post', url, ws_info, json=data)
+    if response is not None:
         logging.debug('The status code from the group account update %s', response.status_code)
         if response.status_code == 204:
             logging.debug(
@@ -1302,8 +1536,6 @@ def add_group_account(ws_info, grp_id, acc_id):
                 grp_id,
                 acc_id
             )
-    except ConnectionError:
-        logging.exception('Connection error to UIM REST API')
 
 
 def create_mm_schedule(ws_info, name, desc, start, duration, t_zone):
@@ -1330,79 +1562,64 @@ def create_mm_schedule(ws_info, name, desc, start, duration, t_zone):
         schedule_id if successful
         None on failure
     '''
-    schedule = {}
-    schedule['name'] = name
-    schedule['description'] = desc
-    schedule['start_date_time'] = {}
-    schedule['start_date_time']['year'] = start.strftime('%Y')
-    schedule['start_date_time']['month'] = start.strftime('%m')
-    schedule['start_date_time']['day'] = start.strftime('%d')
-    schedule['start_date_time']['timestamp'] = {}
-    schedule['start_date_time']['timestamp']['hours'] = start.strftime('%H')
-    schedule['start_date_time']['timestamp']['minutes'] = start.strftime('%M')
-    schedule['start_date_time']['timestamp']['seconds'] = start.strftime('%S')
-    schedule['end_time'] = {}
-    schedule['end_time']['type'] = 'duration'
-    schedule['end_time']['end_date_time'] = {}
-    schedule['end_time']['end_date_time']['month'] = ''
-    schedule['end_time']['end_date_time']['day'] = ''
-    schedule['end_time']['end_date_time']['year'] = ''
-    schedule['end_time']['end_date_time']['timestamp'] = {}
-    schedule['end_time']['end_date_time']['timestamp']['hours'] = ''
-    schedule['end_time']['end_date_time']['timestamp']['minutes'] = ''
-    schedule['end_time']['end_date_time']['timestamp']['seconds'] = ''
-    schedule['end_time']['duration'] = {}
-    schedule['end_time']['duration']['hours'] = str(duration)
-    schedule['end_time']['duration']['minutes'] = ''
-    schedule['end_time']['duration']['seconds'] = ''
-    schedule['account_id'] = ''
-    schedule['recurrence_pattern'] = ''
-    schedule['recurrence_period'] = ''
-    schedule['recurrence_days_of_the_week'] = ''
-    schedule['recurrence_day_of_the_month'] = ''
-    schedule['recurrence_instance'] = ''
-    schedule['recurrence_end_date_time']= {}
-    schedule['recurrence_end_date_time']['month'] = ''
-    schedule['recurrence_end_date_time']['day'] = ''
-    schedule['recurrence_end_date_time']['year'] = ''
-    schedule['recurrence_end_date_time']['timestamp'] = {}
-    schedule['recurrence_end_date_time']['timestamp']['hours'] = ''
-    schedule['recurrence_end_date_time']['timestamp']['minutes'] = ''
-    schedule['recurrence_end_date_time']['timestamp']['seconds'] = ''
-    schedule['timezone'] = t_zone
-
-    url = ws_info['url'] + '/maintenance_mode/' + ws_info['domain'] + '/' + \
-          ws_info['pri_hub'] + '/' + ws_info['mm_robot'] + '/add_schedule'
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
+    # One strftime call covers all six date parts
+    year, month, day, hours, minutes, seconds = \
+        start.strftime('%Y %m %d %H %M %S').split()
+    empty_date_time = {
+        'month': '',
+        'day': '',
+        'year': '',
+        'timestamp': {
+            'hours': '',
+            'minutes': '',
+            'seconds': ''
+        }
+    }
+    schedule = {
+        'name': name,
+        'description': desc,
+        'start_date_time': {
+            'year': year,
+            'month': month,
+            'day': day,
+            'timestamp': {
+                'hours': hours,
+                'minutes': minutes,
+                'seconds': seconds
+            }
+        },
+        'end_time': {
+            'type': 'duration',
+            'end_date_time': empty_date_time,
+            'duration': {
+                'hours': str(duration),
+                'minutes': '',
+                'seconds': ''
+            }
+        },
+        'account_id': '',
+        'recurrence_pattern': '',
+        'recurrence_period': '',
+        'recurrence_days_of_the_week': '',
+        'recurrence_day_of_the_month': '',
+        'recurrence_instance': '',
+        'recurrence_end_date_time': dict(empty_date_time),
+        'timezone': t_zone
     }
+
+    url = f"{ws_info['url']}/maintenance_mode/{ws_info['domain']}/" \
+          f"{ws_info['pri_hub']}/{ws_info['mm_robot']}/add_schedule"
         
     schedule_id = None
-    try:
-        response = post(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers,
-            data=dumps(schedule)
-        )
+    response = _call('post', url, ws_info, json=schedule)
+    if response is not None:
         logging.debug('The status code from the create mm schedule call was %s', response.status_code)
         if response.status_code == 200:
             logging.debug('Successfully created maintenance schedule %s', name)
-            results = loads(response.text)
+            results = response.json()
             schedule_id = results['schedule_id']
         else:
             logging.warning('Failed to create maintenance schedule %s', name)
-    except ConnectionError:
-        logging.exception('Connection error to UIM REST API for maintenance schedule creation')
-
-    except Timeout:
-        logging.exception('Timeout error creating maintenance schedule')
-
     return schedule_id
 
 
@@ -1426,41 +1643,22 @@ def add_cs_to_mm_schedule(ws_info, schedule_id, cs_ids):
         True if successful
         False on failure
     '''
-    url = ws_info['url'] + '/maintenance_mode/' + ws_info['domain'] + '/' + \
-          ws_info['pri_hub'] + '/' + ws_info['mm_robot'] + '/add_computer_systems_to_schedule/' + \
-          str(schedule_id)
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
+    url = f"{ws_info['url']}/maintenance_mode/{ws_info['domain']}/" \
+          f"{ws_info['pri_hub']}/{ws_info['mm_robot']}" \
+          f'/add_computer_systems_to_schedule/{schedule_id}'
     data = {}
     data['cs'] = cs_ids
     logging.debug('List of systems to put in maintenance mode %s', data)
         
     result = False
-    try:
-        response = post(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            headers=headers,
-            data=dumps(data)
-        )
+    response = _call('post', url, ws_info, json=data)
+    if response is not None:
         logging.debug('The status code from the add computers to mm schedule call was %s', response.status_code)
         if response.status_code == 204:
             logging.debug('Successfully added computers to maintenance schedule %s', schedule_id)
             result = True
         else:
             logging.warning('Failed to add computers to maintenance schedule %s', schedule_id)
-    except ConnectionError:
-        logging.exception('Connection error to UIM REST API to add computers to maintenance schedule')
-
-    except Timeout:
-        logging.exception('Timeout error to add computers to maintenance schedule')
-
     return result
 
 
@@ -1485,23 +1683,10 @@ def create_alarm(ws_info, source, ss_id, supp_key, level, msg):
         True if successful, False if it failed
     '''
 
-    url = ws_info['url'] + '/alarms/createAlarm'
-    headers = {
-        'content-type': 'application/json',
-        'accept': 'application/json'
-    }
-
-    severity = {
-        'clear': '0',
-        'info': '1',
-        'warning': '2',
-        'minor': '3',
-        'major': '4',
-        'critical': '5'
-    }
+    url = f"{ws_info['url']}/alarms/createAlarm"
 
     data = {}
-    data['level'] = severity[level]
+    data['level'] = _SEVERITY[level]
     data['message'] = msg
     data['source'] = source
     data['subsystemId'] = ss_id
@@ -1509,28 +1694,45 @@ def create_alarm(ws_info, source, ss_id, supp_key, level, msg):
     data['severity'] = level
     result = False
 
-    try:
-        resp = post(
-            url,
-            auth=HTTPBasicAuth(
-                ws_info['user'],
-                ws_info['password']
-            ),
-            verify=False,
-            timeout=30,
-            headers=headers,
-            data=dumps(data)
-        )
+    resp = _call('post', url, ws_info, timeout=30, json=data)
+    if resp is not None:
         logging.debug('The response from the createAlarm API was %s', resp.status_code)
         if resp.status_code == 204:
             result = True
 
-    except ConnectionError:
-        logging.exception(
-            'Failed to call createAlarm API for source %s with msg %s',
-            source, msg
+    return result
+
+
+def create_alarms(ws_info, alarms, max_workers=8):
+    '''Generates a burst of alarms concurrently
+
+    The createAlarm endpoint takes one alarm per POST, so a storm of
+    alarms is pipelined over the pooled keep-alive session with a
+    thread pool; the caller blocks for roughly the slowest single post
+    instead of the sum of all of them.
+
+    Args:
+        ws_info (dict) UIM web services connection information
+            user (string) UIM user with web service access
+            password (string) UIM user password
+            url (string) UIM REST API URL
+            domain (string) UIM domain name
+        alarms (list) of (source, ss_id, supp_key, level, msg) tuples
+        max_workers (number) of alarms posted concurrently
+
+    Returns:
+        (number) of alarms successfully created
+    '''
+    created = 0
+    if not alarms:
+        return created
+
+    workers = min(max_workers, len(alarms))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        outcomes = executor.map(
+            lambda alarm: create_alarm(ws_info, *alarm),
+            alarms
         )
-    except Timeout:
-        logging.exception('Timeout error to add computers to maintenance schedule')
+        created = sum(1 for result in outcomes if result)
 
-    return result
+    return created
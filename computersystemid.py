@@ -3,9 +3,9 @@
 '''
 from __future__ import print_function
 import logging
-from ConfigParser import SafeConfigParser
+from configparser import ConfigParser
 
-from cauimws import get_comp_sys_ids
+from cauimws import get_comp_sys_ids_bulk
 
 
 def main():
@@ -16,7 +16,7 @@ def main():
     logging.basicConfig(level=logging.ERROR)
 
     # Get configuration data
-    config = SafeConfigParser()
+    config = ConfigParser()
     config.read('conf\\config.ini')
 
     # Init the dict with UIM REST API information
@@ -30,14 +30,16 @@ def main():
     cs_id_list = []
 
     devices = ['server1', 'server2', 'server3', 'server4']
-    for each_device in devices:
-        if each_device:
-            cs_ids = get_comp_sys_ids(uim_ws, each_device)
-            for each_cs_id in cs_ids:
-                cs_id_name_list = []
-                cs_id_name_list.append(each_cs_id)
-                cs_id_name_list.append(each_device)
-                cs_id_list.append(tuple(cs_id_name_list))
+    # Drop blanks and duplicates up front, preserving first-seen order
+    unique_devices = list(dict.fromkeys(device for device in devices if device))
+
+    # Resolve all devices concurrently instead of one round trip each
+    cs_ids_by_device = get_comp_sys_ids_bulk(uim_ws, unique_devices)
+    cs_id_list.extend(
+        (each_cs_id, each_device)
+        for each_device in unique_devices
+        for each_cs_id in cs_ids_by_device.get(each_device, [])
+    )
 
     print(cs_id_list)
 
@@ -3,9 +3,14 @@
 '''
 from __future__ import print_function
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from csv import writer
 from cauimws import get_hubs, get_robots, get_probes
 
+# Number of REST calls kept in flight while walking the hierarchy
+MAX_WORKERS = 32
+
+
 def main():
     '''Lists all the probes and their state in the CA UIM environment
     '''
@@ -20,31 +25,46 @@ def main():
     uim_ws['domain'] = 'uim_domain'
 
     # Setup csv file for output
-    with open('probesList.csv', 'wb') as probes_list:
+    with open('probesList.csv', 'w', newline='', buffering=1 << 20) as probes_list:
         wout = writer(probes_list, delimiter=',')
         header = ['Hub', 'Robot', 'Probe', 'Status']
         wout.writerow(header)
 
-        # Get the list of hubs from UIM
+        # Walk the hub, robot, probe hierarchy with the per-hub and
+        # per-robot calls in flight concurrently instead of one blocking
+        # round trip at a time; executor.map keeps the output ordered
         hubs = get_hubs(uim_ws)
-        for hub in hubs:
-
-            # Get the list of robots assigned to hub
-            robots = get_robots(uim_ws, hub['name'])
-            for robot in robots:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            robot_lists = executor.map(
+                lambda hub: (hub['name'], get_robots(uim_ws, hub['name'])),
+                hubs
+            )
+            pairs = [
+                (hub_name, robot['name'])
+                for hub_name, robots in robot_lists
+                for robot in robots
+            ]
 
-                # Get the list of probes assigned to the robot
-                probes = get_probes(uim_ws, hub['name'], robot['name'])
+            probe_lists = executor.map(
+                lambda pair: (pair, get_probes(uim_ws, pair[0], pair[1])),
+                pairs
+            )
+            for (hub_name, robot_name), probes in probe_lists:
                 if probes:
-                    for probe in probes:
-                        # Translate the probe state
-                        if probe['active'].lower() == 'true':
-                            state = 'Active'
-                        else:
-                            state = 'Inactive'
-                        wout.writerow([hub['name'], robot['name'], probe['name'], state])
+                    # One writerows per robot instead of a writerow per
+                    # probe; the state translation rides in the generator
+                    wout.writerows(
+                        (
+                            hub_name,
+                            robot_name,
+                            probe['name'],
+                            'Active' if probe['active'].lower() == 'true'
+                            else 'Inactive'
+                        )
+                        for probe in probes
+                    )
                 else:
-                    wout.writerow([hub['name'], robot['name'], '', ''])
+                    wout.writerow([hub_name, robot_name, '', ''])
 
 
 
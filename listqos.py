@@ -4,10 +4,14 @@ QOS_MEMORY_PHYSICAL_PERC for each when available
 '''
 from __future__ import print_function
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from csv import writer
 
 from cauimws import get_qos_targets, get_single_qos_value, get_qos_sources
 
+# Number of QOS value requests kept in flight per source
+MAX_WORKERS = 16
+
 
 def main():
     '''Using the current list of robots get the current value of
@@ -23,8 +27,9 @@ def main():
     uim_ws['url'] = 'http://ump.ca.com/rest'
     uim_ws['domain'] = 'uim_domain'
 
-    # Init UIM origin to filter searches
-    origin = 'list_of_origins'
+    # Init UIM origins to filter searches; a frozenset makes the
+    # per-source membership check O(1) instead of a substring scan
+    origins = frozenset(['uim_origin'])
 
     # Init UIM QOS to search
     qos = 'QOS_MEMORY_PHYSICAL_PERC'
@@ -34,31 +39,42 @@ def main():
     end = '201720112359'
 
     # Open the file to write the source and QOS value to
-    with open('physMemValues.csv', 'wb') as phys_mem:
+    with open('physMemValues.csv', 'w', newline='', buffering=1 << 20) as phys_mem:
         wout = writer(phys_mem, delimiter=',')
         header = ['Server', 'Physical Memory Utilization %']
         wout.writerow(header)
 
         # Get a list of UIM sources that collect QOS_MEMORY_PHYSICAL_PERC
         qos_sources = get_qos_sources(uim_ws, qos)
-        for qos_source in qos_sources:
-            if qos_source['origin'][0] in origin:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for qos_source in qos_sources:
+                if qos_source['origin'][0] in origins:
+
+                    # Get a list of targets for the sources in our origin
+                    targets = get_qos_targets(uim_ws, qos_source['source'], qos)
 
-                # Get a list of targets for the sources in our origin
-                targets = get_qos_targets(uim_ws, qos_source['source'], qos)
-                for target in targets:
-                    # Get the QOS value
-                    qos_value = get_single_qos_value(
-                        uim_ws,
-                        qos,
-                        qos_source['source'],
-                        target,
-                        start,
-                        end
-                    )
-                    if qos_value:
-                        wout.writerow([qos_source['source'], qos_value])
-                        break
+                    # Query every target concurrently and take the first
+                    # value that comes back instead of waiting on each
+                    # target in turn before deciding to move on
+                    futures = [
+                        executor.submit(
+                            get_single_qos_value,
+                            uim_ws,
+                            qos,
+                            qos_source['source'],
+                            target,
+                            start,
+                            end
+                        )
+                        for target in targets
+                    ]
+                    for future in as_completed(futures):
+                        qos_value = future.result()
+                        if qos_value:
+                            wout.writerow([qos_source['source'], qos_value])
+                            for pending in futures:
+                                pending.cancel()
+                            break
 
 
 if __name__ == '__main__':
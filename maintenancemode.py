@@ -3,10 +3,10 @@
 '''
 from __future__ import print_function
 import logging
-from ConfigParser import SafeConfigParser
+from configparser import ConfigParser
 from datetime import datetime
 
-from cauimws import create_mm_schedule, add_cs_to_mm_schedule, get_comp_sys_ids
+from cauimws import create_mm_schedule, add_cs_to_mm_schedule, get_comp_sys_ids_bulk
 
 def get_systems_list(filename, ws_info):
     '''Reads the list of systems to put in maintenance and returns their cs_ids in a list
@@ -19,17 +19,20 @@ def get_systems_list(filename, ws_info):
         ["list of strings"]
     '''
 
-    cs_ids = []
+    # Iterate the file lazily instead of a readline call per loop pass
     with open(filename, 'r') as systems:
-        comp_sys_name = systems.readline().strip()
-        while comp_sys_name:
-            logging.info('Processing %s', comp_sys_name)
-            cs_id_list = get_comp_sys_ids(ws_info, comp_sys_name)
-            for id in cs_id_list:
-                cs_ids.append(id)
-            comp_sys_name = systems.readline().strip()
+        names = [line.strip() for line in systems if line.strip()]
 
-    return cs_ids
+    logging.info('Resolving %s systems', len(names))
+
+    # Resolve every system concurrently instead of one round trip each
+    cs_ids_by_name = get_comp_sys_ids_bulk(ws_info, names)
+
+    return [
+        cs_id
+        for name in names
+        for cs_id in cs_ids_by_name.get(name, [])
+    ]
 
 def main():
     '''Sample code for placing things in maintenance mode with the UIM REST API
@@ -49,7 +52,7 @@ def main():
     start = datetime.strptime(start_str, '%Y-%m-%d-%H-%M-%S')
 
     # Get configuration data
-    config = SafeConfigParser()
+    config = ConfigParser()
     config.read('conf\\config.ini')
 
     # Get filename with systems to put in maintenance mode
@@ -1,88 +1,126 @@
-#!/usr/bin/env python
-'''Pushes packages to robots
-'''
-from __future__ import print_function
-import logging
-import logging.handlers
-from configparser import SafeConfigParser
-from time import sleep
-
-from robotdb import create_db, put_robots, has_robot
-from cauimws import get_hubs, get_robots, get_probes, push_pkg
-
-
-def main():
-    '''Pushes packages to robots
-    '''
-    logging.basicConfig(
-        filename='logs\\push-pkg-by-robot.log',
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(funcName)s - %(levelname)s - %(message)s'
-    )
-    logging.info('Starting push-pkg-by-robot')
-    config = SafeConfigParser()
-    config.read('conf\\config-push-pkg-by-robot.ini')
-
-    # Setup retry attempts and delay between tries
-    retries = int(config.get('data', 'retries'))
-    delay = int(config.get('data', 'delay'))
-
-    # Setup UIM web services
-    uim_ws = {}
-    uim_ws['url'] = config.get('uimws', 'url')
-    uim_ws['domain'] = config.get('uimws', 'domain')
-    uim_ws['user'] = config.get('uimws', 'user')
-    uim_ws['password'] = config.get('uimws', 'password')
-
-    # Setup package and automated deployment engine
-    package = config.get('uimws', 'package')
-    ade = config.get('uimws', 'ade')
-
-    # Count number of robots we push packages to
-    times_pushed = 0
-
-    # Setup hub exclusions for robots we are not going to touch
-    excluded = config.get('uimws', 'exclude')
-
-    # Setup sqlite robot database
-    robotdb = config.get('data', 'robotdb')
-    create_db(robotdb)
-
-    # Get the hubs and retrieve the robots from each
-    hubs = get_hubs(uim_ws)
-    for hub in hubs:
-        if hub['name'] not in excluded:
-            robots = get_robots(uim_ws, hub['name'])
-
-            # Populate robot DB with hub to robot relationship needed to push packages
-            put_robots(robotdb, hub['name'], robots)
-
-    with open('data\\targets.txt', 'rb') as targets, \
-         open('reports\\norobot.txt', 'wb') as f_norobot, \
-         open('reports\\pushed.txt', 'wb') as f_pushed:
-        for target in targets:
-            robot = target.strip().lower()
-
-            logging.info('Processing %s', robot)
-            found = has_robot(robotdb, robot)
-            if found:
-                # Found the robot and hub so pushing pushing package
-                pushed = push_pkg(uim_ws, ade, package, found[0], found[1])
-                attempts = 0
-                while not pushed and attempts < retries:
-                    sleep(delay)
-                    pushed = push_pkg(uim_ws, ade, package, found[0], found[1])
-                    attempts += 1
-
-                if pushed:
-                    f_pushed.write('{}\n'.format(robot))
-                    times_pushed += 1
-            else:
-                f_norobot.write('{}\n'.format(robot))
-
-    logging.info('Pushed %s package to %s robots', package, times_pushed)
-    logging.info('End of push-pkg-by-robot')
-
-
-if __name__ == '__main__':
-    main()
+#!/usr/bin/env python
+'''Pushes packages to robots
+'''
+from __future__ import print_function
+import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
+from configparser import ConfigParser
+from random import uniform
+from time import monotonic, sleep
+
+from robotdb import create_db, put_robots
+from cauimws import get_hubs, get_robots, get_probes, push_pkg
+
+
+def main():
+    '''Pushes packages to robots
+    '''
+    logging.basicConfig(
+        filename='logs\\push-pkg-by-robot.log',
+        level=logging.DEBUG,
+        format='%(asctime)s - %(name)s - %(funcName)s - %(levelname)s - %(message)s'
+    )
+    logging.info('Starting push-pkg-by-robot')
+    config = ConfigParser()
+    config.read('conf\\config-push-pkg-by-robot.ini')
+
+    # Read each config section once instead of a scan per key
+    data_conf = dict(config.items('data'))
+    uimws_conf = dict(config.items('uimws'))
+
+    # Setup retry attempts and delay between tries
+    retries = int(data_conf['retries'])
+    delay = int(data_conf['delay'])
+
+    # Setup UIM web services
+    uim_ws = {
+        'url': uimws_conf['url'],
+        'domain': uimws_conf['domain'],
+        'user': uimws_conf['user'],
+        'password': uimws_conf['password']
+    }
+
+    # Setup package and automated deployment engine
+    package = uimws_conf['package']
+    ade = uimws_conf['ade']
+
+    # Count number of robots we push packages to
+    times_pushed = 0
+
+    # Setup hub exclusions for robots we are not going to touch
+    excluded = uimws_conf['exclude']
+
+    # Setup sqlite robot database
+    robotdb = data_conf['robotdb']
+    create_db(robotdb)
+
+    # Get the hubs and retrieve the robots from each; the per-hub REST
+    # calls overlap on a thread pool while the single-writer SQLite
+    # inserts stay on this thread as results stream back in
+    hubs = [hub['name'] for hub in get_hubs(uim_ws) if hub['name'] not in excluded]
+    with ThreadPoolExecutor(max_workers=min(16, max(len(hubs), 1))) as executor:
+        robot_lists = executor.map(
+            lambda hub_name: (hub_name, get_robots(uim_ws, hub_name)),
+            hubs
+        )
+
+        # Populate robot DB with hub to robot relationship and build the
+        # lookup map straight from the fetched lists; the push loop
+        # never needs to read the rows back out of SQLite, the DB file
+        # is kept only as a record of what this run saw
+        robot_map = {}
+        for hub_name, robots in robot_lists:
+            put_robots(robotdb, hub_name, robots)
+            for robot in robots:
+                robot_map[robot['name'].lower()] = (hub_name, robot['name'])
+
+    # Read and normalize the whole target list up front; sorting keeps
+    # robots from the same hub adjacent so pushes hit each hub in runs
+    with open('data\\targets.txt', 'r') as targets:
+        target_names = sorted(
+            target.strip().lower() for target in targets if target.strip()
+        )
+
+    # Collect report lines in memory and write each file in one shot
+    # instead of a write call per target inside the push loop
+    pushed_robots = []
+    norobot_robots = []
+    for robot in target_names:
+        logging.info('Processing %s', robot)
+        found = robot_map.get(robot)
+        if found:
+            # Found the robot and hub so pushing pushing package
+            started = monotonic()
+            pushed = push_pkg(uim_ws, ade, package, found[0], found[1])
+            attempts = 0
+            while not pushed and attempts < retries:
+                # Full-jitter exponential backoff keeps retries from
+                # hammering a congested deployment engine in lockstep;
+                # time already spent in the failed attempt counts
+                # toward the wait so slow failures don't double-wait
+                elapsed = monotonic() - started
+                wait = uniform(0, delay * (2 ** attempts)) - elapsed
+                if wait > 0:
+                    sleep(wait)
+                started = monotonic()
+                pushed = push_pkg(uim_ws, ade, package, found[0], found[1])
+                attempts += 1
+
+            if pushed:
+                pushed_robots.append(robot)
+                times_pushed += 1
+        else:
+            norobot_robots.append(robot)
+
+    with open('reports\\norobot.txt', 'w') as f_norobot, \
+         open('reports\\pushed.txt', 'w') as f_pushed:
+        f_norobot.writelines('{}\n'.format(robot) for robot in norobot_robots)
+        f_pushed.writelines('{}\n'.format(robot) for robot in pushed_robots)
+
+    logging.info('Pushed %s package to %s robots', package, times_pushed)
+    logging.info('End of push-pkg-by-robot')
+
+
+if __name__ == '__main__':
+    main()